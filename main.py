@@ -1,13 +1,28 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit_autorefresh import st_autorefresh
+from bs4 import BeautifulSoup, SoupStrainer
+from selectolax.lexbor import LexborHTMLParser
 import pandas as pd
 from datetime import datetime, timedelta
 import time
+import random
 import json
+import hashlib
+import html
 from urllib.parse import quote_plus, urljoin, urlparse
 import re
-from difflib import SequenceMatcher
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
+from rapidfuzz import fuzz
 
 # Page configuration
 st.set_page_config(
@@ -42,14 +57,18 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state
-if 'all_jobs' not in st.session_state:
-    st.session_state.all_jobs = []
+if 'all_jobs_df' not in st.session_state:
+    st.session_state.all_jobs_df = pd.DataFrame()
 if 'last_update' not in st.session_state:
     st.session_state.last_update = None
 if 'auto_refresh' not in st.session_state:
     st.session_state.auto_refresh = False
 if 'removed_duplicates' not in st.session_state:
     st.session_state.removed_duplicates = 0
+if 'seen_hashes' not in st.session_state:
+    st.session_state.seen_hashes = set()
+if 'all_sources' not in st.session_state:
+    st.session_state.all_sources = set()
 
 # Comprehensive job search keywords
 JOB_KEYWORDS = [
@@ -69,165 +88,408 @@ JOB_KEYWORDS = [
     "System Administrator"
 ]
 
-
+# Jobs are only compared within a block sharing this many leading company characters.
+# is_duplicate needs a near-identical company, so matches outside a block are rare
+# at any similarity threshold
+COMPANY_BLOCK_SIZE = 6
+# Duplicates within one source cluster by page order, so the per-source pass only
+# looks this many unique jobs back within a company block; the cross-source pass
+# searches the whole block
+SOURCE_DEDUP_WINDOW = 200
+
+# ASCII fast path for normalize_text: delete everything except word characters
+# and whitespace, then let str.split() collapse the whitespace
+_ASCII_NONWORD = str.maketrans({
+    chr(c): None for c in range(128) if not (chr(c).isalnum() or chr(c) == '_' or chr(c).isspace())
+})
+
+# Precompiled patterns for non-ASCII text: a run of non-word characters becomes
+# a single space if it contains whitespace, otherwise it is dropped
+_RE_NONWORD_RUN = re.compile(r'\W+')
+_RE_WS = re.compile(r'\s')
+
+
+@dataclass(slots=True)
+class Job:
+    """A scraped job posting"""
+    title: str
+    company: str
+    location: str
+    work_mode: str
+    experience: str
+    salary: str
+    source: str
+    url: str
+    date_posted: str
+    scraped_at: str
+    # Normalized title/company, filled in by remove_duplicates
+    _ntitle: str = ''
+    _ncompany: str = ''
+
+
+JOB_COLUMNS = [field.name for field in fields(Job)]
+
+
+def jobs_to_frame(jobs):
+    """Stored jobs DataFrame, one column per Job field plus derived lookup columns"""
+    df = pd.DataFrame([asdict(job) for job in jobs], columns=JOB_COLUMNS)
+    # Derived once when jobs are stored instead of on every filter or stats pass
+    work_mode_lc = df['work_mode'].str.lower()
+    df['_remote'] = work_mode_lc.str.contains('remote', regex=False)
+    df['_hybrid'] = work_mode_lc.str.contains('hybrid', regex=False)
+    # "title<US>company": the unit separator keeps a keyword from matching across
+    # the two fields
+    df['_search_text'] = (df['title'] + '\x1f' + df['company']).str.lower()
+    return df
+
+
+def jobs_from_frame(df):
+    """Job objects back from the stored DataFrame, for deduplication"""
+    if df.empty:
+        return []
+    return [Job(**row) for row in df[JOB_COLUMNS].to_dict('records')]
+
+
+def _collapse_nonword(match):
+    return ' ' if _RE_WS.search(match.group()) else ''
+
+
+@lru_cache(maxsize=8192)
 def normalize_text(text):
     """Normalize text for comparison"""
     if not text:
         return ""
     # Convert to lowercase, remove extra spaces, special chars
-    text = text.lower().strip()
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text
+    text = text.lower()
+    if text.isascii():
+        return ' '.join(text.translate(_ASCII_NONWORD).split())
+    return _RE_NONWORD_RUN.sub(_collapse_nonword, text).strip()
+
+
+def keyword_pattern(keywords):
+    """Compile keywords into one alternation for matching lowercased text; None if there are none"""
+    keywords = [keyword.strip().lower() for keyword in keywords if keyword.strip()]
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)))
 
 
-def similarity_ratio(str1, str2):
-    """Calculate similarity ratio between two strings"""
-    return SequenceMatcher(None, normalize_text(str1), normalize_text(str2)).ratio()
+def similarity_ratio(str1, str2, threshold=0.0):
+    """
+    Calculate similarity ratio between two strings
+    Returns 0.0 as soon as RapidFuzz can tell the ratio is below threshold
+    """
+    return fuzz.ratio(normalize_text(str1), normalize_text(str2), score_cutoff=threshold * 100) / 100.0
 
 
 def is_duplicate(job1, job2, threshold=0.85):
     """
     Check if two jobs are duplicates based on multiple criteria
+    Expects _ntitle / _ncompany precomputed by remove_duplicates
     Returns True if jobs are considered duplicates
     """
     # Exact match on title + company
-    if (normalize_text(job1['title']) == normalize_text(job2['title']) and
-            normalize_text(job1['company']) == normalize_text(job2['company'])):
+    if job1._ntitle == job2._ntitle and job1._ncompany == job2._ncompany:
         return True
 
-    # High similarity on title + same company
-    title_similarity = similarity_ratio(job1['title'], job2['title'])
-    company_similarity = similarity_ratio(job1['company'], job2['company'])
-
-    if title_similarity >= threshold and company_similarity >= 0.9:
+    # High similarity on title + same company; company first since a
+    # mismatch there makes the title comparison unnecessary
+    if (similarity_ratio(job1._ncompany, job2._ncompany, 0.9) >= 0.9 and
+            similarity_ratio(job1._ntitle, job2._ntitle, threshold) >= threshold):
         return True
 
     # Same URL (if available and not generic)
-    if (job1.get('url') and job2.get('url') and
-            job1['url'] == job2['url'] and
-            'search' not in job1['url'].lower()):
+    if (job1.url and job2.url and
+            job1.url == job2.url and
+            'search' not in job1.url.lower()):
         return True
 
     return False
 
 
-def remove_duplicates(jobs_list, similarity_threshold=0.85):
+def job_hash(job):
+    """Short digest of a job's raw title, company and location for exact repeat checks"""
+    key = '\x1f'.join((job.title, job.company, job.location)).lower()
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+
+
+def remove_duplicates(jobs_list, similarity_threshold=0.85, window=None, known=0):
     """
     Remove duplicate jobs from a list
+    Fuzzy matches are searched within the job's company block; with a window,
+    only among the last `window` unique jobs of that block
+    The first `known` jobs are taken as already unique: they are kept and only
+    indexed, and the jobs after them are compared against them
     Returns: (unique_jobs, num_duplicates_removed)
     """
     if not jobs_list:
         return [], 0
 
+    # Normalize once per job instead of on every comparison; jobs coming back
+    # through a later pass (cross-source, against stored jobs) keep theirs
+    for job in jobs_list:
+        if not job._ntitle:
+            job._ntitle = normalize_text(job.title)
+            job._ncompany = normalize_text(job.company)
+
+    # Pass 1: exact title + company duplicates via hash lookups. Repeats with a
+    # different URL wait for pass 2, since the first copy may itself be dropped
+    # there for its URL and this one would then be unique
+    survivors = []
+    survivor_urls = []
+    seen_exact = set()
+
+    for idx, job in enumerate(jobs_list):
+        url = job.url
+        # Generic search-page URLs are shared by many jobs, so they don't count
+        url_key = url if url and 'search' not in url.lower() else None
+        key = (job._ntitle, job._ncompany, url_key)
+        if idx >= known and key in seen_exact:
+            continue
+
+        seen_exact.add(key)
+        survivors.append(job)
+        survivor_urls.append(url_key)
+
+    # Pass 2: exact, same-URL and fuzzy matches against the jobs actually kept, so
+    # a job is never dropped for matching one that was itself a duplicate.
+    # is_duplicate needs a near-identical company, so only candidates from the
+    # same company block are compared; at 100% only exact and URL matches count
+    fuzzy = similarity_threshold < 1.0
     unique_jobs = []
-    duplicates_removed = 0
+    kept_exact = set()
+    kept_urls = set()
+    # company prefix -> indices of unique survivors, the newest `window` with a window
+    blocks = defaultdict(lambda: deque(maxlen=window) if window else [])
 
-    for job in jobs_list:
-        is_dup = False
-        for unique_job in unique_jobs:
-            if is_duplicate(job, unique_job, similarity_threshold):
-                is_dup = True
-                duplicates_removed += 1
-                break
+    for idx, (job, url_key) in enumerate(zip(survivors, survivor_urls)):
+        key = (job._ntitle, job._ncompany)
+        block = blocks[job._ncompany[:COMPANY_BLOCK_SIZE]]
+
+        candidates = block if idx >= known and fuzzy else ()
 
-        if not is_dup:
-            unique_jobs.append(job)
+        if idx >= known and (key in kept_exact or url_key in kept_urls or
+                             any(is_duplicate(job, survivors[other], similarity_threshold)
+                                 for other in candidates)):
+            continue
 
+        kept_exact.add(key)
+        if url_key:
+            kept_urls.add(url_key)
+        block.append(idx)
+        unique_jobs.append(job)
+
+    duplicates_removed = len(jobs_list) - len(unique_jobs)
     return unique_jobs, duplicates_removed
 
 
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+]
+
+# Shared session so every scraper reuses pooled keep-alive connections. Responses
+# are cached on disk, so auto-refresh cycles revalidate instead of re-downloading
+SESSION = requests_cache.CachedSession(
+    'jobs_cache',
+    backend='sqlite',
+    expire_after=timedelta(minutes=15),
+    stale_if_error=True,
+    allowable_methods=('GET',),
+    cache_control=True,
+)
+SESSION.headers.update({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+})
+
+
+_HEADER_VARIANTS = [{'User-Agent': user_agent} for user_agent in USER_AGENTS]
+
+
 def get_headers():
-    """Return rotating headers for requests"""
-    user_agents = [
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-    ]
-    return {
-        'User-Agent': user_agents[int(time.time()) % len(user_agents)],
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-    }
+    """Return a rotating User-Agent header; the rest live on SESSION"""
+    return random.choice(_HEADER_VARIANTS)
+
+
+# Parallel fetching: a few workers per scraper, throttled per host
+MAX_WORKERS_PER_HOST = 4
+REQUEST_DELAY = 2  # Respectful delay (seconds per request per host, on average)
+
+
+class HostRateLimiter:
+    """Token bucket per host, shared by all fetch threads"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}  # host -> (tokens, last_refill)
+        self._lock = threading.Lock()
+
+    def acquire(self, url):
+        """Block until a request to the url's host is allowed"""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last_refill = self._buckets.get(host, (self.capacity, now))
+                tokens = min(self.capacity, tokens + (now - last_refill) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
+
+
+RATE_LIMITER = HostRateLimiter(rate=1 / REQUEST_DELAY, capacity=MAX_WORKERS_PER_HOST)
+
+
+class ThrottledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that waits for the host's rate limit before every network request"""
+
+    def send(self, request, **kwargs):
+        RATE_LIMITER.acquire(request.url)
+        return super().send(request, **kwargs)
+
+
+# CachedSession only reaches the adapter when a request really goes to the network
+# (misses and revalidations), so fresh cache hits are never throttled
+_adapter = ThrottledHTTPAdapter(pool_connections=20, pool_maxsize=50,
+                                max_retries=Retry(total=3, backoff_factor=0.5))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+
+def fetch(url):
+    """GET a page through the shared session; returns None on network errors"""
+    try:
+        return SESSION.get(url, headers=get_headers(), timeout=20)
+    except requests.RequestException:
+        return None
+
+
+def fetch_all(pages):
+    """
+    Fetch (url, context) pairs concurrently, skipping repeated URLs
+    Yields (url, context, response) in the original order
+    """
+    pages = list(dict(pages).items())
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS_PER_HOST) as executor:
+        responses = executor.map(fetch, [url for url, _ in pages])
+        for (url, context), response in zip(pages, responses):
+            yield url, context, response
+
+
+def has_any_class(*classes):
+    """
+    SoupStrainer attribute filter matching elements that carry any of the classes
+    A plain class_ string or list only matches the whole attribute value while
+    parsing, which misses multi-class cards like "cardOutline job_seen_beacon"
+    """
+    wanted = set(classes)
+
+    def match(value):
+        if not value:
+            return False
+        names = value.split() if isinstance(value, str) else value
+        return not wanted.isdisjoint(names)
+
+    return match
+
+
+# Parse only the job-card subtrees for sites whose card selectors are all class based.
+# Naukri and Google Jobs fall back to attribute-only selectors ([data-job-id],
+# [data-ved]) that a class strainer would drop, so they still parse the full page.
+INDEED_STRAINER = SoupStrainer(['div', 'td', 'a'],
+                               class_=has_any_class('job_seen_beacon', 'resultContent', 'jcs-JobTitle'))
+FOUNDIT_STRAINER = SoupStrainer(['div', 'article'], class_=has_any_class('jobTuple', 'cardWrap'))
+INSTAHYRE_STRAINER = SoupStrainer('div', class_=has_any_class('job-card-component'))
+
+
+def _parse_naukri_cards(cards, location, today, scraped_at):
+    """Yield Job instances from Naukri job tuples, skipping malformed ones"""
+    for job in cards:
+        with suppress(AttributeError, TypeError, KeyError):
+            # Title
+            title_elem = job.find('a', class_='title') or job.find('div', class_='title')
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+            job_url = title_elem.get('href', '') if title_elem.name == 'a' else ''
+
+            # Company
+            company_elem = job.find('a', class_='subTitle') or job.find('div', class_='companyInfo')
+            company = company_elem.text.strip() if company_elem else 'N/A'
+
+            # Location
+            location_elem = job.find('li', class_='location') or job.find('span', class_='location')
+            loc = location_elem.text.strip() if location_elem else location
+
+            # Experience
+            exp_elem = job.find('li', class_='experience') or job.find('span', class_='experience')
+            exp = exp_elem.text.strip() if exp_elem else 'Not specified'
+
+            # Salary
+            sal_elem = job.find('li', class_='salary') or job.find('span', class_='salary')
+            salary = sal_elem.text.strip() if sal_elem else 'Not disclosed'
+
+            # Posted date
+            date_elem = job.find('span', class_='jobTupleFooter')
+            posted = date_elem.text.strip() if date_elem else today
+
+            yield Job(
+                title=title,
+                company=company,
+                location=loc,
+                work_mode='Remote/Hybrid',
+                experience=exp,
+                salary=salary,
+                source='Naukri.com',
+                url=f"https://www.naukri.com{job_url}" if job_url.startswith('/') else job_url,
+                date_posted=posted,
+                scraped_at=scraped_at
+            )
 
 
 def deep_scrape_naukri(location="India", work_mode="remote,hybrid"):
     """Deep scrape Naukri.com with pagination"""
     jobs = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
     keywords_list = ["it-service-desk-jobs"]
 
     try:
+        pages = []
         for keyword in keywords_list:
+            clean_keyword = keyword.replace(" ", "-")
             # Multiple pages
             for page in range(1, 4):  # First 3 pages
-                try:
-                    clean_keyword = keyword.replace(" ", "-")
-                    url = f"https://www.naukri.com/{clean_keyword}-jobs-in-{location}-{page}"
-
-                    response = requests.get(url, headers=get_headers(), timeout=20)
-
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-
-                        # Try multiple selectors
-                        job_articles = soup.find_all('article', class_='jobTuple') or \
-                                       soup.find_all('div', class_='jobTuple') or \
-                                       soup.find_all('div', {'data-job-id': True})
-
-                        for job in job_articles:
-                            try:
-                                # Title
-                                title_elem = job.find('a', class_='title') or job.find('div', class_='title')
-                                if not title_elem:
-                                    continue
-
-                                title = title_elem.text.strip()
-                                job_url = title_elem.get('href', '') if title_elem.name == 'a' else ''
-
-                                # Company
-                                company_elem = job.find('a', class_='subTitle') or job.find('div', class_='companyInfo')
-                                company = company_elem.text.strip() if company_elem else 'N/A'
-
-                                # Location
-                                location_elem = job.find('li', class_='location') or job.find('span', class_='location')
-                                loc = location_elem.text.strip() if location_elem else location
-
-                                # Experience
-                                exp_elem = job.find('li', class_='experience') or job.find('span', class_='experience')
-                                exp = exp_elem.text.strip() if exp_elem else 'Not specified'
-
-                                # Salary
-                                sal_elem = job.find('li', class_='salary') or job.find('span', class_='salary')
-                                salary = sal_elem.text.strip() if sal_elem else 'Not disclosed'
-
-                                # Posted date
-                                date_elem = job.find('span', class_='jobTupleFooter')
-                                posted = date_elem.text.strip() if date_elem else datetime.now().strftime('%Y-%m-%d')
-
-                                jobs.append({
-                                    'title': title,
-                                    'company': company,
-                                    'location': loc,
-                                    'work_mode': 'Remote/Hybrid',
-                                    'experience': exp,
-                                    'salary': salary,
-                                    'source': 'Naukri.com',
-                                    'url': f"https://www.naukri.com{job_url}" if job_url.startswith('/') else job_url,
-                                    'date_posted': posted,
-                                    'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                })
-                            except Exception as e:
-                                continue
-
-                    time.sleep(2)  # Respectful delay
-                except Exception as e:
-                    continue
+                pages.append((f"https://www.naukri.com/{clean_keyword}-jobs-in-{location}-{page}", keyword))
+
+        for url, keyword, response in fetch_all(pages):
+            try:
+                if response is not None and response.status_code == 200:
+                    soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8')
+
+                    # Try multiple selectors
+                    job_articles = soup.find_all('article', class_='jobTuple') or \
+                                   soup.find_all('div', class_='jobTuple') or \
+                                   soup.find_all('div', {'data-job-id': True})
+
+                    jobs.extend(_parse_naukri_cards(job_articles, location, today, scraped_at))
+            except Exception as e:
+                continue
 
     except Exception as e:
         st.warning(f"Naukri.com: {str(e)}")
@@ -235,81 +497,86 @@ def deep_scrape_naukri(location="India", work_mode="remote,hybrid"):
     return jobs
 
 
+def _parse_linkedin_cards(cards, url, work_type, location, today, scraped_at):
+    """Yield Job instances from LinkedIn job cards, skipping malformed ones"""
+    for card in cards:
+        with suppress(AttributeError, TypeError, KeyError):
+            # Title
+            title_elem = card.css_first('h3.base-search-card__title') or \
+                         card.css_first('a.base-card__full-link') or \
+                         card.css_first('h3')
+
+            if not title_elem:
+                continue
+
+            title = title_elem.text().strip()
+
+            # Company
+            company_elem = card.css_first('h4.base-search-card__subtitle') or \
+                           card.css_first('a.hidden-nested-link') or \
+                           card.css_first('h4')
+            company = company_elem.text().strip() if company_elem else 'N/A'
+
+            # Location
+            location_elem = card.css_first('span.job-search-card__location') or \
+                            card.css_first('span.job-card-container__metadata-item')
+            loc = location_elem.text().strip() if location_elem else location
+
+            # URL
+            link_elem = card.css_first('a.base-card__full-link')
+            job_url = (link_elem.attributes.get('href') or '') if link_elem else url
+
+            # Posted time
+            time_elem = card.css_first('time')
+            posted = time_elem.attributes.get('datetime', today) if time_elem else today
+
+            yield Job(
+                title=title,
+                company=company,
+                location=loc,
+                work_mode='Remote' if work_type == '2' else 'Hybrid',
+                experience='See posting',
+                salary='Not disclosed',
+                source='LinkedIn',
+                url=job_url,
+                date_posted=posted,
+                scraped_at=scraped_at
+            )
+
+
 def deep_scrape_linkedin(location="India"):
     """Deep scrape LinkedIn with multiple searches"""
     jobs = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
     keywords_list = ["IT service desk", "help desk",
                      "service desk analyst", "desktop support", "L1 support"]
 
     try:
+        pages = []
         for keyword in keywords_list:
             # Remote and Hybrid
             for work_type in ["2", "3"]:  # 2=Remote, 3=Hybrid
-                try:
-                    # Multiple pages
-                    for start in [0, 25, 50]:  # Pagination
-                        url = f"https://www.linkedin.com/jobs/search?keywords={quote_plus(keyword)}&location={location}&f_WT={work_type}&start={start}"
-
-                        response = requests.get(url, headers=get_headers(), timeout=20)
-
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.content, 'html.parser')
-
-                            # Multiple selectors
-                            job_cards = soup.find_all('div', class_='base-card') or \
-                                        soup.find_all('div', class_='job-search-card') or \
-                                        soup.find_all('li', class_='jobs-search-results__list-item')
-
-                            for card in job_cards:
-                                try:
-                                    # Title
-                                    title_elem = card.find('h3', class_='base-search-card__title') or \
-                                                 card.find('a', class_='base-card__full-link') or \
-                                                 card.find('h3')
-
-                                    if not title_elem:
-                                        continue
-
-                                    title = title_elem.text.strip()
-
-                                    # Company
-                                    company_elem = card.find('h4', class_='base-search-card__subtitle') or \
-                                                   card.find('a', class_='hidden-nested-link') or \
-                                                   card.find('h4')
-                                    company = company_elem.text.strip() if company_elem else 'N/A'
-
-                                    # Location
-                                    location_elem = card.find('span', class_='job-search-card__location') or \
-                                                    card.find('span', class_='job-card-container__metadata-item')
-                                    loc = location_elem.text.strip() if location_elem else location
-
-                                    # URL
-                                    link_elem = card.find('a', class_='base-card__full-link')
-                                    job_url = link_elem.get('href', '') if link_elem else url
-
-                                    # Posted time
-                                    time_elem = card.find('time')
-                                    posted = time_elem.get('datetime', datetime.now().strftime(
-                                        '%Y-%m-%d')) if time_elem else datetime.now().strftime('%Y-%m-%d')
-
-                                    jobs.append({
-                                        'title': title,
-                                        'company': company,
-                                        'location': loc,
-                                        'work_mode': 'Remote' if work_type == '2' else 'Hybrid',
-                                        'experience': 'See posting',
-                                        'salary': 'Not disclosed',
-                                        'source': 'LinkedIn',
-                                        'url': job_url,
-                                        'date_posted': posted,
-                                        'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                    })
-                                except Exception as e:
-                                    continue
-
-                        time.sleep(2)
-                except Exception as e:
-                    continue
+                # Multiple pages
+                for start in [0, 25, 50]:  # Pagination
+                    url = f"https://www.linkedin.com/jobs/search?keywords={quote_plus(keyword)}&location={location}&f_WT={work_type}&start={start}"
+                    pages.append((url, work_type))
+
+        for url, work_type, response in fetch_all(pages):
+            try:
+                if response is not None and response.status_code == 200:
+                    # Largest pages we fetch, so they go through selectolax's C parser
+                    tree = LexborHTMLParser(response.content)
+
+                    # Multiple selectors
+                    job_cards = tree.css('div.base-card') or \
+                                tree.css('div.job-search-card') or \
+                                tree.css('li.jobs-search-results__list-item')
+
+                    jobs.extend(_parse_linkedin_cards(job_cards, url, work_type, location, today, scraped_at))
+            except Exception as e:
+                continue
 
     except Exception as e:
         st.warning(f"LinkedIn: {str(e)}")
@@ -317,83 +584,87 @@ def deep_scrape_linkedin(location="India"):
     return jobs
 
 
+def _parse_indeed_cards(cards, url, remote_filter, location, today, scraped_at):
+    """Yield Job instances from Indeed job cards, skipping malformed ones"""
+    for card in cards:
+        with suppress(AttributeError, TypeError, KeyError):
+            # Title
+            title_elem = card.find('h2', class_='jobTitle') or \
+                         card.find('a', class_='jcs-JobTitle') or \
+                         card.find('span', title=True)
+
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            # Company
+            company_elem = card.find('span', {'data-testid': 'company-name'}) or \
+                           card.find('span', class_='companyName')
+            company = company_elem.text.strip() if company_elem else 'N/A'
+
+            # Location
+            location_elem = card.find('div', {'data-testid': 'text-location'}) or \
+                            card.find('div', class_='companyLocation')
+            loc = location_elem.text.strip() if location_elem else location
+
+            # Salary
+            salary_elem = card.find('div', class_='salary-snippet')
+            salary = salary_elem.text.strip() if salary_elem else 'Not disclosed'
+
+            # URL
+            link_elem = card.find('a', class_='jcs-JobTitle')
+            job_url = f"https://in.indeed.com{link_elem['href']}" if link_elem and link_elem.get(
+                'href') else url
+
+            # Posted
+            date_elem = card.find('span', class_='date')
+            posted = date_elem.text.strip() if date_elem else today
+
+            yield Job(
+                title=title,
+                company=company,
+                location=loc,
+                work_mode='Remote' if remote_filter == 'remotejob' else 'Hybrid',
+                experience='See posting',
+                salary=salary,
+                source='Indeed India',
+                url=job_url,
+                date_posted=posted,
+                scraped_at=scraped_at
+            )
+
+
 def deep_scrape_indeed(location="India"):
     """Deep scrape Indeed India"""
     jobs = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
     keywords_list = ["it+service+desk"]
 
     try:
+        pages = []
         for keyword in keywords_list:
             # Multiple pages and work modes
             for start in [0, 10, 20, 30]:  # 4 pages
                 for remote_filter in ["remotejob", "hybrid"]:
-                    try:
-                        url = f"https://in.indeed.com/jobs?q={quote_plus(keyword)}&l={location}&{remote_filter}=1&start={start}"
-
-                        response = requests.get(url, headers=get_headers(), timeout=20)
-
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.content, 'html.parser')
-
-                            # Multiple selectors
-                            job_cards = soup.find_all('div', class_='job_seen_beacon') or \
-                                        soup.find_all('td', class_='resultContent') or \
-                                        soup.find_all('a', class_='jcs-JobTitle')
-
-                            for card in job_cards:
-                                try:
-                                    # Title
-                                    title_elem = card.find('h2', class_='jobTitle') or \
-                                                 card.find('a', class_='jcs-JobTitle') or \
-                                                 card.find('span', title=True)
-
-                                    if not title_elem:
-                                        continue
-
-                                    title = title_elem.text.strip()
-
-                                    # Company
-                                    company_elem = card.find('span', {'data-testid': 'company-name'}) or \
-                                                   card.find('span', class_='companyName')
-                                    company = company_elem.text.strip() if company_elem else 'N/A'
-
-                                    # Location
-                                    location_elem = card.find('div', {'data-testid': 'text-location'}) or \
-                                                    card.find('div', class_='companyLocation')
-                                    loc = location_elem.text.strip() if location_elem else location
-
-                                    # Salary
-                                    salary_elem = card.find('div', class_='salary-snippet')
-                                    salary = salary_elem.text.strip() if salary_elem else 'Not disclosed'
-
-                                    # URL
-                                    link_elem = card.find('a', class_='jcs-JobTitle')
-                                    job_url = f"https://in.indeed.com{link_elem['href']}" if link_elem and link_elem.get(
-                                        'href') else url
-
-                                    # Posted
-                                    date_elem = card.find('span', class_='date')
-                                    posted = date_elem.text.strip() if date_elem else datetime.now().strftime(
-                                        '%Y-%m-%d')
-
-                                    jobs.append({
-                                        'title': title,
-                                        'company': company,
-                                        'location': loc,
-                                        'work_mode': 'Remote' if remote_filter == 'remotejob' else 'Hybrid',
-                                        'experience': 'See posting',
-                                        'salary': salary,
-                                        'source': 'Indeed India',
-                                        'url': job_url,
-                                        'date_posted': posted,
-                                        'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                    })
-                                except Exception as e:
-                                    continue
-
-                        time.sleep(2)
-                    except Exception as e:
-                        continue
+                    url = f"https://in.indeed.com/jobs?q={quote_plus(keyword)}&l={location}&{remote_filter}=1&start={start}"
+                    pages.append((url, remote_filter))
+
+        for url, remote_filter, response in fetch_all(pages):
+            try:
+                if response is not None and response.status_code == 200:
+                    soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8', parse_only=INDEED_STRAINER)
+
+                    # Multiple selectors
+                    job_cards = soup.find_all('div', class_='job_seen_beacon') or \
+                                soup.find_all('td', class_='resultContent') or \
+                                soup.find_all('a', class_='jcs-JobTitle')
+
+                    jobs.extend(_parse_indeed_cards(job_cards, url, remote_filter, location, today, scraped_at))
+            except Exception as e:
+                continue
 
     except Exception as e:
         st.warning(f"Indeed India: {str(e)}")
@@ -401,64 +672,68 @@ def deep_scrape_indeed(location="India"):
     return jobs
 
 
+def _parse_google_jobs_cards(cards, url, work_mode, location, today, scraped_at):
+    """Yield Job instances from Google Jobs cards, skipping malformed ones"""
+    for card in cards:
+        with suppress(AttributeError, TypeError, KeyError):
+            # Extract job data from Google's structure
+            title_elem = card.find('div', class_='BjJfJf')
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            # Company
+            company_elem = card.find('div', class_='vNEEBe')
+            company = company_elem.text.strip() if company_elem else 'N/A'
+
+            # Location
+            location_elem = card.find('div', class_='Qk80Jf')
+            loc = location_elem.text.strip() if location_elem else location
+
+            yield Job(
+                title=title,
+                company=company,
+                location=loc,
+                work_mode=work_mode.capitalize(),
+                experience='See posting',
+                salary='Not disclosed',
+                source='Google Jobs',
+                url=url,
+                date_posted=today,
+                scraped_at=scraped_at
+            )
+
+
 def deep_scrape_google_jobs(location="India"):
     """Deep scrape Google Jobs"""
     jobs = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
     keywords_list = ["IT service desk", "help desk", "technical support", "IT support engineer",
                      "service desk analyst", "desktop support engineer"]
 
     try:
+        pages = []
         for keyword in keywords_list:
             for work_mode in ["remote", "hybrid"]:
-                try:
-                    query = f"{keyword} {work_mode} {location}"
-                    url = f"https://www.google.com/search?q={quote_plus(query)}&ibp=htl;jobs&htidocid="
-
-                    response = requests.get(url, headers=get_headers(), timeout=20)
-
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-
-                        # Google Jobs specific selectors
-                        job_cards = soup.find_all('div', class_='PwjeAc') or \
-                                    soup.find_all('li', class_='iFjolb') or \
-                                    soup.find_all('div', {'data-ved': True})
-
-                        for card in job_cards[:10]:  # Limit per search
-                            try:
-                                # Extract job data from Google's structure
-                                title_elem = card.find('div', class_='BjJfJf')
-                                if not title_elem:
-                                    continue
-
-                                title = title_elem.text.strip()
-
-                                # Company
-                                company_elem = card.find('div', class_='vNEEBe')
-                                company = company_elem.text.strip() if company_elem else 'N/A'
-
-                                # Location
-                                location_elem = card.find('div', class_='Qk80Jf')
-                                loc = location_elem.text.strip() if location_elem else location
-
-                                jobs.append({
-                                    'title': title,
-                                    'company': company,
-                                    'location': loc,
-                                    'work_mode': work_mode.capitalize(),
-                                    'experience': 'See posting',
-                                    'salary': 'Not disclosed',
-                                    'source': 'Google Jobs',
-                                    'url': url,
-                                    'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                                    'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                })
-                            except Exception as e:
-                                continue
-
-                    time.sleep(2)
-                except Exception as e:
-                    continue
+                query = f"{keyword} {work_mode} {location}"
+                pages.append((f"https://www.google.com/search?q={quote_plus(query)}&ibp=htl;jobs&htidocid=", work_mode))
+
+        for url, work_mode, response in fetch_all(pages):
+            try:
+                if response is not None and response.status_code == 200:
+                    soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8')
+
+                    # Google Jobs specific selectors
+                    job_cards = soup.find_all('div', class_='PwjeAc') or \
+                                soup.find_all('li', class_='iFjolb') or \
+                                soup.find_all('div', {'data-ved': True})
+
+                    jobs.extend(_parse_google_jobs_cards(job_cards[:10], url, work_mode, location, today, scraped_at))  # Limit per search
+            except Exception as e:
+                continue
 
     except Exception as e:
         st.warning(f"Google Jobs: {str(e)}")
@@ -466,64 +741,68 @@ def deep_scrape_google_jobs(location="India"):
     return jobs
 
 
+def _parse_foundit_cards(cards, url, location, today, scraped_at):
+    """Yield Job instances from Foundit job cards, skipping malformed ones"""
+    for card in cards:
+        with suppress(AttributeError, TypeError, KeyError):
+            title_elem = card.find('a', {'data-test-id': 'job-title'}) or card.find('h3')
+            if not title_elem:
+                continue
+
+            title = title_elem.text.strip()
+
+            company_elem = card.find('a', {'data-test-id': 'company-name'}) or card.find('p',
+                                                                                         class_='company')
+            company = company_elem.text.strip() if company_elem else 'N/A'
+
+            location_elem = card.find('span', class_='location')
+            loc = location_elem.text.strip() if location_elem else location
+
+            exp_elem = card.find('span', class_='experience')
+            exp = exp_elem.text.strip() if exp_elem else 'Not specified'
+
+            salary_elem = card.find('span', class_='salary')
+            salary = salary_elem.text.strip() if salary_elem else 'Not disclosed'
+
+            job_url = title_elem.get('href', url) if title_elem.name == 'a' else url
+
+            yield Job(
+                title=title,
+                company=company,
+                location=loc,
+                work_mode='Remote/Hybrid',
+                experience=exp,
+                salary=salary,
+                source='Foundit',
+                url=job_url,
+                date_posted=today,
+                scraped_at=scraped_at
+            )
+
+
 def deep_scrape_foundit(location="India"):
     """Deep scrape Foundit (Monster India)"""
     jobs = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
     keywords_list = ["IT service desk", "help desk", "technical support", "IT support"]
 
     try:
+        pages = []
         for keyword in keywords_list:
-            try:
-                clean_keyword = quote_plus(keyword)
-                url = f"https://www.foundit.in/srp/results?query={clean_keyword}&locations={location}"
+            clean_keyword = quote_plus(keyword)
+            pages.append((f"https://www.foundit.in/srp/results?query={clean_keyword}&locations={location}", keyword))
 
-                response = requests.get(url, headers=get_headers(), timeout=20)
-
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
+        for url, keyword, response in fetch_all(pages):
+            try:
+                if response is not None and response.status_code == 200:
+                    soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8', parse_only=FOUNDIT_STRAINER)
 
                     job_cards = soup.find_all('div', class_='jobTuple') or \
                                 soup.find_all('article', class_='cardWrap')
 
-                    for card in job_cards:
-                        try:
-                            title_elem = card.find('a', {'data-test-id': 'job-title'}) or card.find('h3')
-                            if not title_elem:
-                                continue
-
-                            title = title_elem.text.strip()
-
-                            company_elem = card.find('a', {'data-test-id': 'company-name'}) or card.find('p',
-                                                                                                         class_='company')
-                            company = company_elem.text.strip() if company_elem else 'N/A'
-
-                            location_elem = card.find('span', class_='location')
-                            loc = location_elem.text.strip() if location_elem else location
-
-                            exp_elem = card.find('span', class_='experience')
-                            exp = exp_elem.text.strip() if exp_elem else 'Not specified'
-
-                            salary_elem = card.find('span', class_='salary')
-                            salary = salary_elem.text.strip() if salary_elem else 'Not disclosed'
-
-                            job_url = title_elem.get('href', url) if title_elem.name == 'a' else url
-
-                            jobs.append({
-                                'title': title,
-                                'company': company,
-                                'location': loc,
-                                'work_mode': 'Remote/Hybrid',
-                                'experience': exp,
-                                'salary': salary,
-                                'source': 'Foundit',
-                                'url': job_url,
-                                'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                                'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            })
-                        except Exception as e:
-                            continue
-
-                time.sleep(2)
+                    jobs.extend(_parse_foundit_cards(job_cards, url, location, today, scraped_at))
             except Exception as e:
                 continue
 
@@ -533,59 +812,62 @@ def deep_scrape_foundit(location="India"):
     return jobs
 
 
-def deep_scrape_instahyre():
-    """Deep scrape Instahyre"""
-    jobs = []
+def _parse_instahyre_cards(cards, url, today, scraped_at):
+    """Yield Job instances from Instahyre job cards, skipping malformed ones"""
+    for card in cards:
+        with suppress(AttributeError, TypeError, KeyError):
+            title_elem = card.find('p', class_='job-title')
+            if not title_elem:
+                continue
 
-    try:
-        keywords_list = ["IT service desk", "help desk", "technical support"]
+            title = title_elem.text.strip()
 
-        for keyword in keywords_list:
-            url = f"https://www.instahyre.com/search-jobs/?q={quote_plus(keyword)}&remote=true"
+            company_elem = card.find('p', class_='company-name')
+            company = company_elem.text.strip() if company_elem else 'N/A'
 
-            response = requests.get(url, headers=get_headers(), timeout=20)
+            location_elem = card.find('span', class_='job-location')
+            loc = location_elem.text.strip() if location_elem else 'Remote - India'
 
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            exp_elem = card.find('span', class_='experience')
+            exp = exp_elem.text.strip() if exp_elem else 'Not specified'
 
-                job_cards = soup.find_all('div', class_='job-card-component')
+            salary_elem = card.find('span', class_='salary')
+            salary = salary_elem.text.strip() if salary_elem else 'Not disclosed'
 
-                for card in job_cards:
-                    try:
-                        title_elem = card.find('p', class_='job-title')
-                        if not title_elem:
-                            continue
+            yield Job(
+                title=title,
+                company=company,
+                location=loc,
+                work_mode='Remote',
+                experience=exp,
+                salary=salary,
+                source='Instahyre',
+                url=url,
+                date_posted=today,
+                scraped_at=scraped_at
+            )
 
-                        title = title_elem.text.strip()
 
-                        company_elem = card.find('p', class_='company-name')
-                        company = company_elem.text.strip() if company_elem else 'N/A'
+def deep_scrape_instahyre():
+    """Deep scrape Instahyre"""
+    jobs = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    scraped_at = now.strftime('%Y-%m-%d %H:%M:%S')
 
-                        location_elem = card.find('span', class_='job-location')
-                        loc = location_elem.text.strip() if location_elem else 'Remote - India'
+    try:
+        keywords_list = ["IT service desk", "help desk", "technical support"]
 
-                        exp_elem = card.find('span', class_='experience')
-                        exp = exp_elem.text.strip() if exp_elem else 'Not specified'
+        pages = [(f"https://www.instahyre.com/search-jobs/?q={quote_plus(keyword)}&remote=true", keyword)
+                 for keyword in keywords_list]
 
-                        salary_elem = card.find('span', class_='salary')
-                        salary = salary_elem.text.strip() if salary_elem else 'Not disclosed'
+        for url, keyword, response in fetch_all(pages):
+            if response is not None and response.status_code == 200:
+                soup = BeautifulSoup(response.content, 'lxml', from_encoding='utf-8', parse_only=INSTAHYRE_STRAINER)
 
-                        jobs.append({
-                            'title': title,
-                            'company': company,
-                            'location': loc,
-                            'work_mode': 'Remote',
-                            'experience': exp,
-                            'salary': salary,
-                            'source': 'Instahyre',
-                            'url': url,
-                            'date_posted': datetime.now().strftime('%Y-%m-%d'),
-                            'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        })
-                    except Exception as e:
-                        continue
+                job_cards = soup.find_all('div', class_='job-card-component')
 
-            time.sleep(2)
+                jobs.extend(_parse_instahyre_cards(job_cards, url, today, scraped_at))
 
     except Exception as e:
         st.warning(f"Instahyre: {str(e)}")
@@ -610,28 +892,38 @@ def scrape_all_sources(location="India", work_modes=["remote"], dedup_threshold=
     status_text = st.empty()
     result_container = st.container()
 
-    for idx, (name, scraper) in enumerate(sources):
-        status_text.text(f"🔍 Deep scraping {name}... This may take a while.")
+    def run_scraper(scraper):
+        start_time = time.time()
+        jobs = scraper()
+        return jobs, time.time() - start_time
 
-        with result_container:
-            start_time = time.time()
-            try:
-                jobs = scraper()
-                elapsed = time.time() - start_time
-
-                if len(jobs) > 0:
-                    # Remove duplicates within this source
-                    unique_jobs, source_dups = remove_duplicates(jobs, dedup_threshold)
-
-                    st.success(
-                        f"✅ {name}: Found **{len(jobs)}** jobs, **{len(unique_jobs)}** unique (removed {source_dups} duplicates) in {elapsed:.1f}s")
-                    all_jobs.extend(unique_jobs)
-                else:
-                    st.info(f"ℹ️ {name}: No jobs found")
-            except Exception as e:
-                st.error(f"❌ {name}: {str(e)}")
+    status_text.text(f"🔍 Deep scraping {len(sources)} sources in parallel... This may take a while.")
+
+    # Scraper threads need the script context to report warnings in the page
+    with ThreadPoolExecutor(max_workers=len(sources), initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as executor:
+        futures = {executor.submit(run_scraper, scraper): name for name, scraper in sources}
+
+        for idx, future in enumerate(as_completed(futures)):
+            name = futures[future]
+
+            with result_container:
+                try:
+                    jobs, elapsed = future.result()
+
+                    if len(jobs) > 0:
+                        # Remove duplicates within this source
+                        unique_jobs, source_dups = remove_duplicates(jobs, dedup_threshold, SOURCE_DEDUP_WINDOW)
+
+                        st.success(
+                            f"✅ {name}: Found **{len(jobs)}** jobs, **{len(unique_jobs)}** unique (removed {source_dups} duplicates) in {elapsed:.1f}s")
+                        all_jobs.extend(unique_jobs)
+                    else:
+                        st.info(f"ℹ️ {name}: No jobs found")
+                except Exception as e:
+                    st.error(f"❌ {name}: {str(e)}")
 
-        progress_bar.progress((idx + 1) / len(sources))
+            progress_bar.progress((idx + 1) / len(sources))
 
     status_text.empty()
     progress_bar.empty()
@@ -646,7 +938,24 @@ def scrape_all_sources(location="India", work_modes=["remote"], dedup_threshold=
     return all_jobs, 0
 
 
+def cached_in_session(name, key, compute):
+    """Return compute(), memoized in st.session_state under name until key changes"""
+    cached = st.session_state.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, compute())
+        st.session_state[name] = cached
+    return cached[1]
+
+
+def jobs_version():
+    """Changes whenever a scrape or a clear changes the stored jobs"""
+    return len(st.session_state.all_jobs_df), st.session_state.removed_duplicates, st.session_state.last_update
+
+
 # Main App UI
+# One timestamp for the whole run (a scrape stamps its own completion time)
+now = datetime.now()
+
 st.markdown('<div class="main-header">💼 Suba Job Search</div>', unsafe_allow_html=True)
 
 # Sidebar
@@ -717,9 +1026,11 @@ with st.sidebar:
     st.info("⏱️ Deep scraping takes 2-5 minutes with delays between requests.")
 
     if st.button("🗑️ Clear All Jobs", type="secondary", use_container_width=True):
-        st.session_state.all_jobs = []
+        st.session_state.all_jobs_df = pd.DataFrame()
         st.session_state.last_update = None
         st.session_state.removed_duplicates = 0
+        st.session_state.seen_hashes = set()
+        st.session_state.all_sources = set()
         st.rerun()
 
 # Live indicator
@@ -739,145 +1050,209 @@ with col1:
             new_jobs, cross_dups = scrape_all_sources(selected_location, [m.lower() for m in work_modes],
                                                       dedup_threshold)
 
-            # Remove duplicates against existing jobs
-            combined_jobs = st.session_state.all_jobs + new_jobs
-            final_unique_jobs, final_dups = remove_duplicates(combined_jobs, dedup_threshold)
+            # Exact repeats of already scraped jobs are dropped by hash, so the
+            # fuzzy pass below only sees genuinely new candidates
+            fresh_jobs = []
+            for job in new_jobs:
+                digest = job_hash(job)
+                if digest not in st.session_state.seen_hashes:
+                    st.session_state.seen_hashes.add(digest)
+                    fresh_jobs.append(job)
+
+            existing_count = len(st.session_state.all_jobs_df)
+            if fresh_jobs:
+                # Remove duplicates against existing jobs; those are already unique,
+                # so only the fresh ones are checked, within their company block
+                combined_jobs = jobs_from_frame(st.session_state.all_jobs_df) + fresh_jobs
+                final_unique_jobs, _ = remove_duplicates(combined_jobs, dedup_threshold, known=existing_count)
+                # Stored jobs come first and are all kept, so the added ones follow them
+                added_jobs = final_unique_jobs[existing_count:]
+                added_df = jobs_to_frame(added_jobs)
+                if existing_count:
+                    added_df = pd.concat([st.session_state.all_jobs_df, added_df], ignore_index=True)
+                st.session_state.all_jobs_df = added_df
+                st.session_state.all_sources.update(job.source for job in added_jobs)
 
             # Calculate truly new jobs
-            truly_new = len(final_unique_jobs) - len(st.session_state.all_jobs)
-            total_dups_removed = len(new_jobs) - truly_new + cross_dups + final_dups
+            truly_new = len(st.session_state.all_jobs_df) - existing_count
+            total_dups_removed = len(new_jobs) - truly_new + cross_dups
 
-            st.session_state.all_jobs = final_unique_jobs
             st.session_state.removed_duplicates += total_dups_removed
             st.session_state.last_update = datetime.now()
 
             if truly_new > 0:
                 st.success(
-                    f"✅ Added **{truly_new}** new unique jobs! Removed **{total_dups_removed}** duplicates. Total: **{len(st.session_state.all_jobs)}**")
+                    f"✅ Added **{truly_new}** new unique jobs! Removed **{total_dups_removed}** duplicates. Total: **{len(st.session_state.all_jobs_df)}**")
             else:
                 st.warning(f"⚠️ No new unique jobs found. Removed **{total_dups_removed}** duplicates.")
 
 with col2:
-    if st.session_state.all_jobs:
-        df = pd.DataFrame(st.session_state.all_jobs)
-        csv = df.to_csv(index=False)
+    if not st.session_state.all_jobs_df.empty:
+        def export_csv():
+            df = st.session_state.all_jobs_df
+            # Drop all underscore-prefixed internal columns (dedup keys, lookup flags) from the export
+            df = df.loc[:, ~df.columns.str.startswith('_')]
+            return df.to_csv(index=False).encode('utf-8')
+
+        csv = cached_in_session('_csv_cache', jobs_version(), export_csv)
         st.download_button(
             label="📥 Export to CSV",
             data=csv,
-            file_name=f"it_service_desk_jobs_{selected_location.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            file_name=f"it_service_desk_jobs_{selected_location.replace(' ', '_')}_{now.strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
             use_container_width=True
         )
 
 with col3:
     if st.session_state.last_update:
-        time_ago = datetime.now() - st.session_state.last_update
+        time_ago = now - st.session_state.last_update
         minutes_ago = int(time_ago.total_seconds() / 60)
         if minutes_ago < 1:
             st.metric("Updated", "Now")
         else:
             st.metric("Updated", f"{minutes_ago}m")
 
-# Statistics
-if st.session_state.all_jobs:
+
+@st.fragment
+def _render_jobs_panel():
+    """Stats, filters and job list; their widgets rerun only this panel"""
+    if st.session_state.all_jobs_df.empty:
+        st.info("👆 Click 'Start Deep Scraping' to begin searching for jobs!")
+        return
+
+    # Statistics
     st.markdown("---")
     col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
 
+    # Column-wise metrics over the stored DataFrame, counted once per change to
+    # the jobs (or the date) instead of on every rerun
+    jobs_df = st.session_state.all_jobs_df
+    today_str = datetime.now().strftime('%Y-%m-%d')
+
+    def count_job_stats():
+        distinct_counts = jobs_df[['source', 'company']].nunique()
+        # Remote/hybrid flags are stored per job, so both counts come from one
+        # column-wise sum
+        mode_counts = jobs_df[['_remote', '_hybrid']].sum()
+        return {
+            'sources': int(distinct_counts['source']),
+            'companies': int(distinct_counts['company']),
+            'remote': int(mode_counts['_remote']),
+            'hybrid': int(mode_counts['_hybrid']),
+            'today': int((jobs_df['date_posted'] == today_str).sum()),
+        }
+
+    job_stats = cached_in_session('_stats_cache', (jobs_version(), today_str), count_job_stats)
+
     with col1:
-        st.metric("📊 Total", len(st.session_state.all_jobs))
+        st.metric("📊 Total", len(jobs_df))
 
     with col2:
-        sources = set([job['source'] for job in st.session_state.all_jobs])
-        st.metric("🌐 Sources", len(sources))
+        st.metric("🌐 Sources", job_stats['sources'])
 
     with col3:
-        companies = set([job['company'] for job in st.session_state.all_jobs])
-        st.metric("🏢 Companies", len(companies))
+        st.metric("🏢 Companies", job_stats['companies'])
 
     with col4:
-        remote_jobs = [job for job in st.session_state.all_jobs if 'remote' in job['work_mode'].lower()]
-        st.metric("🏠 Remote", len(remote_jobs))
+        st.metric("🏠 Remote", job_stats['remote'])
 
     with col5:
-        hybrid_jobs = [job for job in st.session_state.all_jobs if 'hybrid' in job['work_mode'].lower()]
-        st.metric("🔀 Hybrid", len(hybrid_jobs))
+        st.metric("🔀 Hybrid", job_stats['hybrid'])
 
     with col6:
-        today_jobs = [job for job in st.session_state.all_jobs if
-                      job['date_posted'] == datetime.now().strftime('%Y-%m-%d')]
-        st.metric("📅 Today", len(today_jobs))
+        st.metric("📅 Today", job_stats['today'])
 
     with col7:
         st.metric("🗑️ Removed", st.session_state.removed_duplicates)
 
-# Display jobs
-if st.session_state.all_jobs:
+    # Display jobs
     st.markdown("---")
-    st.subheader(f"📋 Found {len(st.session_state.all_jobs)} Unique Jobs")
-
-    # Apply filters
-    filtered_jobs = st.session_state.all_jobs.copy()
-
-    if filter_keywords:
-        keywords = [k.strip().lower() for k in filter_keywords.split(',')]
-        filtered_jobs = [
-            job for job in filtered_jobs
-            if any(keyword in job['title'].lower() or keyword in job['company'].lower()
-                   for keyword in keywords)
-        ]
-
-    # Source filter
-    available_sources = list(set([job['source'] for job in filtered_jobs]))
-    selected_sources = st.multiselect(
+    st.subheader(f"📋 Found {len(jobs_df)} Unique Jobs")
+
+    # Filters are boolean masks over the stored DataFrame; results are cached so
+    # reruns from unrelated widgets skip the scans
+
+    def apply_keyword_filter():
+        filter_pattern = keyword_pattern(filter_keywords.split(','))
+        if filter_pattern:
+            # One scan per job over the stored lowercased "title<US>company"
+            mask = jobs_df['_search_text'].str.contains(filter_pattern)
+        else:
+            mask = pd.Series(True, index=jobs_df.index)
+        return mask
+
+    keyword_key = (filter_keywords, jobs_version())
+    keyword_mask = cached_in_session('_keyword_filter_cache', keyword_key, apply_keyword_filter)
+
+    # Source filter; the options are kept up to date as scrapes add jobs
+    available_sources = sorted(st.session_state.all_sources)
+    selected_sources = set(st.multiselect(
         "Filter by Source",
         available_sources,
         default=available_sources
-    )
+    ))
 
-    filtered_jobs = [job for job in filtered_jobs if job['source'] in selected_sources]
+    def apply_source_filter():
+        mask = keyword_mask & jobs_df['source'].isin(selected_sources)
+        # Boolean indexing copies every row, so skip it when nothing is filtered out
+        return jobs_df if mask.all() else jobs_df[mask]
+
+    filtered_jobs = cached_in_session('_filter_cache', (keyword_key, tuple(sorted(selected_sources))),
+                                      apply_source_filter)
 
     # Display filtered count
-    if len(filtered_jobs) < len(st.session_state.all_jobs):
+    if len(filtered_jobs) < len(jobs_df):
         st.info(f"Showing {len(filtered_jobs)} jobs after filtering")
 
-    # Determine how many jobs to display
-    jobs_to_display = filtered_jobs if max_display is None else filtered_jobs[:max_display]
+    # Determine which page of jobs to display
+    if max_display is None or len(filtered_jobs) <= max_display:
+        page_start = 0
+        jobs_to_display = filtered_jobs
+    else:
+        page_count = -(-len(filtered_jobs) // max_display)
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        page_start = (page - 1) * max_display
+        jobs_to_display = filtered_jobs.iloc[page_start:page_start + max_display]
 
     # Display jobs
-    for idx, job in enumerate(jobs_to_display):
-        with st.expander(f"**{job['title']}** at {job['company']} - {job['work_mode']}", expanded=False):
+    for job in jobs_to_display.itertuples(index=False):
+        with st.expander(f"**{job.title}** at {job.company} - {job.work_mode}", expanded=False):
             col1, col2 = st.columns([3, 1])
 
             with col1:
-                st.markdown(f"**🏢 Company:** {job['company']}")
-                st.markdown(f"**📍 Location:** {job['location']}")
-                st.markdown(f"**💼 Work Mode:** {job['work_mode']}")
-                st.markdown(f"**👔 Experience:** {job['experience']}")
-                st.markdown(f"**💰 Salary:** {job['salary']}")
-                st.markdown(f"**🌐 Source:** {job['source']}")
-                st.markdown(f"**📅 Posted:** {job['date_posted']}")
-                st.markdown(f"**🕐 Scraped:** {job['scraped_at']}")
+                # One markdown element per card; scraped values are escaped since
+                # they end up in raw HTML
+                st.markdown('<br>'.join(
+                    f"<b>{label}:</b> {html.escape(str(value))}"
+                    for label, value in (
+                        ("🏢 Company", job.company),
+                        ("📍 Location", job.location),
+                        ("💼 Work Mode", job.work_mode),
+                        ("👔 Experience", job.experience),
+                        ("💰 Salary", job.salary),
+                        ("🌐 Source", job.source),
+                        ("📅 Posted", job.date_posted),
+                        ("🕐 Scraped", job.scraped_at),
+                    )
+                ), unsafe_allow_html=True)
 
             with col2:
-                if job['url']:
-                    st.link_button("🔗 View Job", job['url'], use_container_width=True)
+                if job.url:
+                    st.link_button("🔗 View Job", job.url, use_container_width=True)
 
     # Show message if display is limited
-    if max_display is not None and len(filtered_jobs) > max_display:
+    if len(jobs_to_display) < len(filtered_jobs):
         st.warning(
-            f"⚠️ Showing {max_display} of {len(filtered_jobs)} jobs. Check 'Show All Jobs' in the sidebar to see all results.")
+            f"⚠️ Showing jobs {page_start + 1}-{page_start + len(jobs_to_display)} of {len(filtered_jobs)}. "
+            f"Change the page or check 'Show All Jobs' in the sidebar to see all results.")
 
-else:
-    st.info("👆 Click 'Start Deep Scraping' to begin searching for jobs!")
 
-# Auto-refresh logic
-if auto_refresh and st.session_state.last_update:
-    time_since_update = (datetime.now() - st.session_state.last_update).total_seconds() / 60
+_render_jobs_panel()
 
-    if time_since_update >= refresh_interval:
-        st.info(f"🔄 Auto-refresh triggered after {refresh_interval} minutes...")
-        time.sleep(2)
-        st.rerun()
+# Auto-refresh logic: the browser schedules the rerun, so no server thread
+# sleeps waiting for the interval
+if auto_refresh and st.session_state.last_update:
+    st_autorefresh(interval=refresh_interval * 60_000, key='refresh')
 
 # Footer
 st.markdown("---")
\ No newline at end of file